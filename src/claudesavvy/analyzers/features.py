@@ -1,6 +1,7 @@
 """Analyzer for Claude Code features (sub-agents, skills, MCPs)."""
 
 from dataclasses import dataclass
+from itertools import islice
 from typing import Optional
 
 from ..parsers.tools import ToolUsageParser, ToolStats
@@ -124,7 +125,7 @@ class FeaturesAnalyzer:
             List of (tool_name, ToolStats) tuples
         """
         tool_stats = self.tool_parser.get_tool_stats(time_filter=self.time_filter)
-        return list(tool_stats.items())[:limit]
+        return list(islice(tool_stats.items(), limit))
 
     def get_top_subagents(self, limit: int = 10) -> list[tuple[str, ToolStats]]:
         """
@@ -137,4 +138,4 @@ class FeaturesAnalyzer:
             List of (subagent_type, ToolStats) tuples
         """
         subagent_stats = self.tool_parser.get_subagent_stats(time_filter=self.time_filter)
-        return list(subagent_stats.items())[:limit]
+        return list(islice(subagent_stats.items(), limit))
@@ -1,6 +1,7 @@
 """Integration analyzer for MCP server usage."""
 
 from dataclasses import dataclass
+from itertools import islice
 
 from ..parsers.debug import DebugLogParser, MCPServerStats
 
@@ -45,12 +46,14 @@ class IntegrationAnalyzer:
         """
         all_stats = self.debug_parser.get_all_mcp_stats()
 
-        total_tool_calls = sum(s.tool_call_count for s in all_stats.values())
-        total_connections = sum(s.connection_count for s in all_stats.values())
-        total_errors = sum(s.error_count for s in all_stats.values())
+        total_tool_calls = total_connections = total_errors = 0
+        for stats in all_stats.values():
+            total_tool_calls += stats.tool_call_count
+            total_connections += stats.connection_count
+            total_errors += stats.error_count
 
         # Get top servers by tool call count
-        top_servers = list(all_stats.items())[:limit]
+        top_servers = list(islice(all_stats.items(), limit))
 
         return IntegrationSummary(
             total_servers=len(all_stats),
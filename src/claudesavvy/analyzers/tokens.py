@@ -3,7 +3,8 @@
 from dataclasses import dataclass
 from typing import Optional, TYPE_CHECKING, Dict
 
-from ..parsers.sessions import SessionParser, TokenUsage
+from ..parsers.sessions import SessionParser, SessionStats, TokenUsage
+from ..utils.pricing import per_token_rates
 from ..utils.time_filter import TimeFilter
 
 if TYPE_CHECKING:
@@ -90,11 +91,16 @@ _add_bedrock_aliases('claude-haiku-4-5-20251001', 'claude-haiku-4-5-20251001-v1:
 # Default pricing (Sonnet 4.5)
 DEFAULT_PRICING = MODEL_PRICING['claude-sonnet-4-5-20250929']
 
+# Cache reads billed as regular input would cost this many times more
+_CACHE_SAVINGS_MULT = DEFAULT_PRICING['input_per_mtok'] / DEFAULT_PRICING['cache_read_per_mtok'] - 1.0
+
 
 @dataclass
 class CostBreakdown:
     """Breakdown of costs by token type."""
 
+    __slots__ = ('cache_read_cost', 'cache_write_cost', 'input_cost', 'output_cost')
+
     input_cost: float
     output_cost: float
     cache_write_cost: float
@@ -111,15 +117,15 @@ class CostBreakdown:
         Calculate savings from cache hits.
         Savings = what cache reads would have cost as regular input - actual cache read cost
         """
-        # If cache reads were regular input tokens instead
-        regular_cost = (self.cache_read_cost / DEFAULT_PRICING['cache_read_per_mtok']) * DEFAULT_PRICING['input_per_mtok']
-        return regular_cost - self.cache_read_cost
+        return self.cache_read_cost * _CACHE_SAVINGS_MULT
 
 
 @dataclass
 class TokenSummary:
     """Summary of token usage and costs."""
 
+    __slots__ = ('cache_efficiency_pct', 'cost_breakdown', 'total_tokens')
+
     total_tokens: TokenUsage
     cost_breakdown: CostBreakdown
     cache_efficiency_pct: float
@@ -159,21 +165,60 @@ class TokenAnalyzer:
         self.session_parser = session_parser
         self.time_filter = time_filter
         self.pricing_settings = pricing_settings
+        self._stats_cache: dict[tuple, SessionStats] = {}
+        self._project_stats_cache: dict[tuple, dict[str, SessionStats]] = {}
+
+    def _cache_key(self) -> tuple:
+        """Key identifying the time filter and current session file state."""
+        return (id(self.time_filter), self.session_parser.get_files_signature())
+
+    def _get_stats(self) -> SessionStats:
+        """
+        Get session stats for the current time filter, reusing the last parse.
+
+        The cached stats are keyed on the time filter and the session files'
+        modification state, so new session data invalidates the cache.
+
+        Returns:
+            SessionStats with aggregated data
+        """
+        key = self._cache_key()
+        stats = self._stats_cache.get(key)
+        if stats is None:
+            stats = self.session_parser.get_stats(time_filter=self.time_filter)
+            self._stats_cache = {key: stats}
+        return stats
+
+    def _get_project_stats(self) -> dict[str, SessionStats]:
+        """
+        Get per-project session stats, reusing the last parse.
+
+        Cached the same way as _get_stats.
 
-    def _get_pricing_for_model(self, model: Optional[str]) -> Dict[str, float]:
+        Returns:
+            Dict mapping project paths to SessionStats
+        """
+        key = self._cache_key()
+        project_stats = self._project_stats_cache.get(key)
+        if project_stats is None:
+            project_stats = self.session_parser.get_project_stats(time_filter=self.time_filter)
+            self._project_stats_cache = {key: project_stats}
+        return project_stats
+
+    def _get_pricing_for_model(self, model: Optional[str]) -> tuple[float, float, float, float]:
         """
-        Get pricing configuration for a model.
+        Get per-token rates for a model.
 
         Args:
             model: Model identifier
 
         Returns:
-            Pricing dictionary with pricing per token type.
+            Tuple of (input, output, cache_write, cache_read) per-token rates.
             Uses custom pricing if available, otherwise default pricing.
         """
         if self.pricing_settings and model:
-            return self.pricing_settings.get_pricing_for_model(model)
-        return MODEL_PRICING.get(model, DEFAULT_PRICING)
+            return self.pricing_settings.get_per_token_rates(model)
+        return per_token_rates(MODEL_PRICING.get(model, DEFAULT_PRICING))
 
     def calculate_cost(self, tokens: TokenUsage, model: Optional[str] = None) -> CostBreakdown:
         """
@@ -187,12 +232,32 @@ class TokenAnalyzer:
             CostBreakdown with calculated costs
         """
         # Get pricing for the specific model (with custom override if set)
-        pricing = self._get_pricing_for_model(model)
+        input_rate, output_rate, cache_write_rate, cache_read_rate = self._get_pricing_for_model(model)
 
-        input_cost = (tokens.input_tokens / 1_000_000) * pricing['input_per_mtok']
-        output_cost = (tokens.output_tokens / 1_000_000) * pricing['output_per_mtok']
-        cache_write_cost = (tokens.cache_creation_input_tokens / 1_000_000) * pricing['cache_write_per_mtok']
-        cache_read_cost = (tokens.cache_read_input_tokens / 1_000_000) * pricing['cache_read_per_mtok']
+        return CostBreakdown(
+            input_cost=tokens.input_tokens * input_rate,
+            output_cost=tokens.output_tokens * output_rate,
+            cache_write_cost=tokens.cache_creation_input_tokens * cache_write_rate,
+            cache_read_cost=tokens.cache_read_input_tokens * cache_read_rate
+        )
+
+    def _aggregate_cost(self, model_usage: dict[str, TokenUsage]) -> CostBreakdown:
+        """
+        Sum per-model costs into a single breakdown.
+
+        Args:
+            model_usage: Dict mapping model names to TokenUsage
+
+        Returns:
+            CostBreakdown with costs summed across all models
+        """
+        input_cost = output_cost = cache_write_cost = cache_read_cost = 0.0
+        for model, tokens in model_usage.items():
+            cost = self.calculate_cost(tokens, model)
+            input_cost += cost.input_cost
+            output_cost += cost.output_cost
+            cache_write_cost += cost.cache_write_cost
+            cache_read_cost += cost.cache_read_cost
 
         return CostBreakdown(
             input_cost=input_cost,
@@ -208,27 +273,11 @@ class TokenAnalyzer:
         Returns:
             TokenSummary with aggregated data
         """
-        # Get session stats
-        stats = self.session_parser.get_stats(time_filter=self.time_filter)
-
-        # Calculate costs per model and aggregate
-        total_cost = CostBreakdown(
-            input_cost=0.0,
-            output_cost=0.0,
-            cache_write_cost=0.0,
-            cache_read_cost=0.0
-        )
-
-        for model, tokens in stats.model_usage.items():
-            model_cost = self.calculate_cost(tokens, model)
-            total_cost.input_cost += model_cost.input_cost
-            total_cost.output_cost += model_cost.output_cost
-            total_cost.cache_write_cost += model_cost.cache_write_cost
-            total_cost.cache_read_cost += model_cost.cache_read_cost
+        stats = self._get_stats()
 
         return TokenSummary(
             total_tokens=stats.total_tokens,
-            cost_breakdown=total_cost,
+            cost_breakdown=self._aggregate_cost(stats.model_usage),
             cache_efficiency_pct=stats.total_tokens.cache_efficiency_percentage
         )
 
@@ -239,7 +288,7 @@ class TokenAnalyzer:
         Returns:
             Dict mapping model names to (TokenUsage, cost) tuples
         """
-        stats = self.session_parser.get_stats(time_filter=self.time_filter)
+        stats = self._get_stats()
         breakdown = {}
 
         for model, tokens in stats.model_usage.items():
@@ -256,23 +305,25 @@ class TokenAnalyzer:
         Returns:
             Dict mapping project names to dict of (model -> (TokenUsage, cost))
         """
-        project_stats = self.session_parser.get_project_stats(time_filter=self.time_filter)
-        result = {}
+        project_stats = self._get_project_stats()
+        result = []
 
         for project, stats in project_stats.items():
             project_models = {}
+            project_total = 0.0
             for model, tokens in stats.model_usage.items():
-                cost = self.calculate_cost(tokens, model)
-                project_models[model] = (tokens, cost.total_cost)
+                cost = self.calculate_cost(tokens, model).total_cost
+                project_models[model] = (tokens, cost)
+                project_total += cost
 
             if project_models:
                 # Sort by cost descending
-                result[project] = dict(sorted(project_models.items(), key=lambda x: x[1][1], reverse=True))
+                sorted_models = dict(sorted(project_models.items(), key=lambda x: x[1][1], reverse=True))
+                result.append((project, sorted_models, project_total))
 
         # Sort projects by total cost descending
-        return dict(sorted(result.items(),
-                          key=lambda x: sum(c for _, c in x[1].values()),
-                          reverse=True))
+        result.sort(key=lambda x: x[2], reverse=True)
+        return {project: models for project, models, _ in result}
 
     def get_project_breakdown(self) -> dict[str, TokenSummary]:
         """
@@ -283,28 +334,14 @@ class TokenAnalyzer:
         Returns:
             Dict mapping project paths to TokenSummary
         """
-        project_stats = self.session_parser.get_project_stats(time_filter=self.time_filter)
+        project_stats = self._get_project_stats()
 
         breakdown = {}
         for project, stats in project_stats.items():
             # Calculate costs per model and aggregate for accurate pricing
-            total_cost = CostBreakdown(
-                input_cost=0.0,
-                output_cost=0.0,
-                cache_write_cost=0.0,
-                cache_read_cost=0.0
-            )
-
-            for model, tokens in stats.model_usage.items():
-                model_cost = self.calculate_cost(tokens, model)
-                total_cost.input_cost += model_cost.input_cost
-                total_cost.output_cost += model_cost.output_cost
-                total_cost.cache_write_cost += model_cost.cache_write_cost
-                total_cost.cache_read_cost += model_cost.cache_read_cost
-
             breakdown[project] = TokenSummary(
                 total_tokens=stats.total_tokens,
-                cost_breakdown=total_cost,
+                cost_breakdown=self._aggregate_cost(stats.model_usage),
                 cache_efficiency_pct=stats.total_tokens.cache_efficiency_percentage
             )
 
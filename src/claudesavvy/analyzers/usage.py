@@ -120,7 +120,7 @@ class UsageAnalyzer:
         breakdown = {}
         for project in all_projects:
             # Shorten project path for display
-            short_name = project.split('/')[-1] if '/' in project else project
+            short_name = project.rpartition('/')[2]
 
             breakdown[project] = {
                 'name': short_name,
@@ -3,7 +3,6 @@
 import sys
 import click
 from pathlib import Path
-from rich.console import Console
 
 from .utils.paths import get_claude_paths, ClaudeDataPaths
 
@@ -58,6 +57,9 @@ def main(port, host, debug, claude_dir):
       # Use custom Claude data directory
       $ claudesavvy --claude-dir /path/to/claude/data
     """
+    # Lazy import Rich so --help and option errors skip its import cost
+    from rich.console import Console
+
     console = Console()
 
     try:
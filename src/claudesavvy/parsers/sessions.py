@@ -1,5 +1,6 @@
 """Parser for Claude Code session files containing token usage data."""
 
+import heapq
 import json
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -38,6 +39,11 @@ class TokenUsage:
             + self.cache_read_input_tokens
         )
 
+    @property
+    def all_tokens(self) -> int:
+        """Total tokens including cache and output tokens."""
+        return self.total_input_tokens + self.output_tokens
+
     @property
     def cache_efficiency_percentage(self) -> float:
         """Calculate cache efficiency as percentage of cache reads."""
@@ -121,16 +127,25 @@ class SessionStats:
     latest_timestamp: Optional[datetime] = None
     model_usage: dict[str, TokenUsage] = field(default_factory=dict)  # Tokens per model
 
+    @staticmethod
+    def _accumulate(target: TokenUsage, usage: TokenUsage) -> None:
+        """Add usage into a TokenUsage owned by these stats, in place."""
+        target.input_tokens += usage.input_tokens
+        target.output_tokens += usage.output_tokens
+        target.cache_creation_input_tokens += usage.cache_creation_input_tokens
+        target.cache_read_input_tokens += usage.cache_read_input_tokens
+
     def add_message(self, message: SessionMessage):
         """Add a message to the statistics."""
         if message.usage:
-            self.total_tokens += message.usage
+            self._accumulate(self.total_tokens, message.usage)
 
             # Track tokens per model
             if message.model:
-                if message.model not in self.model_usage:
-                    self.model_usage[message.model] = TokenUsage()
-                self.model_usage[message.model] += message.usage
+                model_usage = self.model_usage.get(message.model)
+                if model_usage is None:
+                    model_usage = self.model_usage[message.model] = TokenUsage()
+                self._accumulate(model_usage, message.usage)
 
         self.message_count += 1
         self.session_ids.add(message.session_id)
@@ -169,6 +184,25 @@ class SessionParser:
         """
         self.session_files = session_files
 
+    def get_files_signature(self) -> tuple:
+        """
+        Get a cheap fingerprint of the session files' current state.
+
+        Used by analyzers to detect when cached stats are stale without
+        re-parsing every file.
+
+        Returns:
+            Tuple of (path, mtime_ns, size) for each existing session file
+        """
+        signature = []
+        for session_file in self.session_files:
+            try:
+                stat = session_file.stat()
+            except OSError:
+                continue
+            signature.append((session_file, stat.st_mtime_ns, stat.st_size))
+        return tuple(signature)
+
     def parse_file(
         self, session_file: Path, time_filter: Optional[TimeFilter] = None
     ) -> Iterator[SessionMessage]:
@@ -285,8 +319,7 @@ class SessionParser:
         return dict(
             sorted(
                 project_stats.items(),
-                key=lambda x: x[1].total_tokens.total_input_tokens
-                + x[1].total_tokens.output_tokens,
+                key=lambda x: x[1].total_tokens.all_tokens,
                 reverse=True,
             )
         )
@@ -438,9 +471,9 @@ class SessionParser:
             )
 
         # Get top projects
-        top_projects = sorted(project_costs.items(), key=lambda x: x[1], reverse=True)[
-            :max_projects
-        ]
+        top_projects = heapq.nlargest(
+            max_projects, project_costs.items(), key=lambda x: x[1]
+        )
 
         # Initialize result structure
         result = {}
@@ -17,6 +17,24 @@ DEFAULT_PRICING = {
 }
 
 
+def per_token_rates(pricing: dict[str, float]) -> tuple[float, float, float, float]:
+    """
+    Convert per-million-token pricing into per-token rates.
+
+    Args:
+        pricing: Pricing dictionary with *_per_mtok keys
+
+    Returns:
+        Tuple of (input, output, cache_write, cache_read) per-token rates
+    """
+    return (
+        pricing['input_per_mtok'] * 1e-6,
+        pricing['output_per_mtok'] * 1e-6,
+        pricing['cache_write_per_mtok'] * 1e-6,
+        pricing['cache_read_per_mtok'] * 1e-6,
+    )
+
+
 class PricingSettings:
     """Manages custom pricing settings for Claude models."""
 
@@ -30,6 +48,7 @@ class PricingSettings:
         self.settings_dir = settings_dir
         self.pricing_file = settings_dir / "pricing.json"
         self._custom_pricing: Optional[Dict[str, Dict[str, float]]] = None
+        self._per_token_rates: dict[str, tuple[float, float, float, float]] = {}
 
     def load_custom_pricing(self) -> Dict[str, Dict[str, float]]:
         """
@@ -66,6 +85,9 @@ class PricingSettings:
         Returns:
             True if save was successful, False otherwise.
         """
+        # Callers edit the pricing dict before saving, so converted rates are stale
+        self._per_token_rates.clear()
+
         try:
             # Ensure settings directory exists
             self.settings_dir.mkdir(parents=True, exist_ok=True)
@@ -110,6 +132,23 @@ class PricingSettings:
         # Fall back to default pricing
         return DEFAULT_PRICING
 
+    def get_per_token_rates(self, model: str) -> tuple[float, float, float, float]:
+        """
+        Get per-token rates for a specific model, converting each model once.
+
+        Args:
+            model: Model identifier
+
+        Returns:
+            Tuple of (input, output, cache_write, cache_read) per-token rates
+            for the model's custom pricing if set, otherwise default pricing.
+        """
+        rates = self._per_token_rates.get(model)
+        if rates is None:
+            rates = per_token_rates(self.get_pricing_for_model(model))
+            self._per_token_rates[model] = rates
+        return rates
+
     def set_pricing_for_model(
         self,
         model: str,
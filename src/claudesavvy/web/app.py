@@ -6,6 +6,7 @@ the Claude Monitor web application.
 
 import os
 from datetime import datetime
+from functools import lru_cache
 from flask import Flask, jsonify
 from typing import Optional
 
@@ -88,21 +89,25 @@ def create_app(claude_data_paths: Optional[ClaudeDataPaths] = None) -> Flask:
             hours = seconds / 3600
             return f'{hours:.1f}h'
 
+    @lru_cache(maxsize=4096)
+    def _format_compact_num(num: float) -> str:
+        """Format an already-converted float in compact form (memoized)."""
+        if num >= 1_000_000_000:
+            return f'{num / 1_000_000_000:,.2f}B'
+        elif num >= 1_000_000:
+            return f'{num / 1_000_000:,.2f}M'
+        elif num >= 1_000:
+            return f'{num / 1_000:,.1f}K'
+        else:
+            return f'{num:,.0f}'
+
     @app.template_filter('format_compact')
     def format_compact(value: float) -> str:
         """Format a large number in compact form (e.g., 1.5M, 234K)."""
         if value is None:
             return '0'
         try:
-            num = float(value)
-            if num >= 1_000_000_000:
-                return f'{num / 1_000_000_000:,.2f}B'
-            elif num >= 1_000_000:
-                return f'{num / 1_000_000:,.2f}M'
-            elif num >= 1_000:
-                return f'{num / 1_000:,.1f}K'
-            else:
-                return f'{num:,.0f}'
+            return _format_compact_num(float(value))
         except (ValueError, TypeError):
             return str(value)
 
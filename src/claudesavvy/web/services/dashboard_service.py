@@ -5,8 +5,11 @@ by wrapping existing parsers and analyzers. It reuses all existing business logi
 while returning data as dicts/dataclasses suitable for web rendering.
 """
 
+import heapq
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Optional, Dict, List, Any
 
 from ...utils.paths import get_claude_paths, ClaudeDataPaths
@@ -32,6 +35,12 @@ from ...analyzers.configuration import ConfigurationAnalyzer
 from ...analyzers.project_analyzer import ProjectAnalyzer
 
 
+@lru_cache(maxsize=1024)
+def _project_name(project: str) -> str:
+    """Return the display name (final path component) for a project path."""
+    return Path(project).name
+
+
 class DashboardService:
     """Service for providing dashboard data to web routes.
 
@@ -39,6 +48,41 @@ class DashboardService:
     aggregated data suitable for web rendering.
     """
 
+    # Chart palettes, shared read-only across requests
+    PROJECT_TREND_COLORS = (
+        "#0770E3",  # Blue
+        "#34D399",  # Green
+        "#F59E0B",  # Amber
+        "#8B5CF6",  # Purple
+        "#EC4899",  # Pink
+        "#14B8A6",  # Teal
+        "#F97316",  # Orange
+        "#6366F1",  # Indigo
+    )
+
+    SUBAGENT_TYPE_COLORS = MappingProxyType({
+        "explore": "#0770E3",  # Blue
+        "Explore": "#0770E3",
+        "general": "#34D399",  # Green
+        "research": "#F59E0B",  # Amber
+        "code": "#8B5CF6",  # Purple
+        "unknown": "#6B7280",  # Gray
+    })
+
+    TOOL_COLORS = MappingProxyType({
+        "Read": {"bg": "#3B82F680", "border": "#3B82F6"},  # Blue
+        "Write": {"bg": "#10B98180", "border": "#10B981"},  # Green
+        "Edit": {"bg": "#F59E0B80", "border": "#F59E0B"},  # Amber
+        "Bash": {"bg": "#6366F180", "border": "#6366F1"},  # Indigo
+        "Glob": {"bg": "#8B5CF680", "border": "#8B5CF6"},  # Violet
+        "Grep": {"bg": "#EC489980", "border": "#EC4899"},  # Pink
+        "Task": {"bg": "#EF444480", "border": "#EF4444"},  # Red
+        "WebFetch": {"bg": "#06B6D480", "border": "#06B6D4"},  # Cyan
+        "TodoWrite": {"bg": "#84CC1680", "border": "#84CC16"},  # Lime
+        "TodoRead": {"bg": "#22C55E80", "border": "#22C55E"},  # Green
+    })
+    DEFAULT_TOOL_COLOR = MappingProxyType({"bg": "#6B728080", "border": "#6B7280"})  # Gray
+
     def __init__(self, claude_data_paths: Optional[ClaudeDataPaths] = None):
         """
         Initialize dashboard service with parsers and analyzers.
@@ -97,6 +141,9 @@ class DashboardService:
         self._config_scanner = ConfigurationScanner(self._config_parser)
         self._configuration_analyzer = ConfigurationAnalyzer(self._config_scanner)
 
+        # Most recently used time-filtered service, keyed by time range
+        self._filtered_service_cache: dict[tuple, DashboardService] = {}
+
         # Initialize project analyzer
         self._project_analyzer = ProjectAnalyzer(
             self._session_parser,
@@ -162,6 +209,7 @@ class DashboardService:
         service._skills_parser = self._skills_parser
         service._config_parser = self._config_parser
         service._debug_parser = self._debug_parser
+        service._filtered_service_cache = {}
 
         # Create time-filtered analyzers
         service._usage_analyzer = UsageAnalyzer(
@@ -198,7 +246,15 @@ class DashboardService:
         """
         if not time_filter:
             return getattr(self, f'_{analyzer_name}')
-        return getattr(self._create_time_filtered_service(time_filter), f'_{analyzer_name}')
+
+        # Reuse the filtered service while callers keep asking for the same
+        # time range, so analyzer-level caches survive across service calls
+        key = (time_filter.start_time, time_filter.end_time)
+        service = self._filtered_service_cache.get(key)
+        if service is None:
+            service = self._create_time_filtered_service(time_filter)
+            self._filtered_service_cache = {key: service}
+        return getattr(service, f'_{analyzer_name}')
 
     def _build_project_dict(
         self, project_path: str, project_data: dict, total_tokens: int, cost: float
@@ -229,24 +285,6 @@ class DashboardService:
             "messages": project_data["messages"],
         }
 
-    def _calculate_total_tokens(self, tokens) -> int:
-        """
-        Calculate total tokens from a token object.
-
-        Args:
-            tokens: Token object with input_tokens, output_tokens, cache_creation_input_tokens,
-                   and cache_read_input_tokens attributes
-
-        Returns:
-            Sum of all token types
-        """
-        return (
-            tokens.input_tokens
-            + tokens.output_tokens
-            + tokens.cache_creation_input_tokens
-            + tokens.cache_read_input_tokens
-        )
-
     def _extract_mcp_server_name(self, tool_name: str) -> Optional[str]:
         """
         Extract MCP server name from tool name.
@@ -336,7 +374,7 @@ class DashboardService:
             cost = 0.0
 
             if token_summary:
-                total_tokens = self._calculate_total_tokens(token_summary.total_tokens)
+                total_tokens = token_summary.total_tokens.all_tokens
                 cost = token_summary.total_cost
                 total_cost += cost
 
@@ -400,7 +438,7 @@ class DashboardService:
 
             if model_id in project_models:
                 tokens, cost = project_models[model_id]
-                total_tokens = self._calculate_total_tokens(tokens)
+                total_tokens = tokens.all_tokens
                 total_cost += cost
 
                 # Track most active by cost for model filter
@@ -482,7 +520,7 @@ class DashboardService:
         total_cost = sum(cost for _, cost in breakdown.values())
 
         for model_id, (tokens, cost) in breakdown.items():
-            total_tokens = self._calculate_total_tokens(tokens)
+            total_tokens = tokens.all_tokens
             models_data.append(
                 {
                     "model_id": model_id,
@@ -553,7 +591,7 @@ class DashboardService:
         for date_str in sorted(daily_stats.keys()):
             stats = daily_stats[date_str]
             # Calculate total tokens for this day
-            total = self._calculate_total_tokens(stats.total_tokens)
+            total = stats.total_tokens.all_tokens
             data.append(total)
 
             # Create human-readable label based on how many days we're showing
@@ -670,7 +708,7 @@ class DashboardService:
         # Get date labels from the first project
         labels = []
         if project_daily_stats:
-            first_project = list(project_daily_stats.values())[0]
+            first_project = next(iter(project_daily_stats.values()))
             today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
 
             for date_str in sorted(first_project.keys()):
@@ -690,16 +728,7 @@ class DashboardService:
 
         # Build datasets for each project
         datasets = []
-        colors = [
-            "#0770E3",  # Blue
-            "#34D399",  # Green
-            "#F59E0B",  # Amber
-            "#8B5CF6",  # Purple
-            "#EC4899",  # Pink
-            "#14B8A6",  # Teal
-            "#F97316",  # Orange
-            "#6366F1",  # Indigo
-        ]
+        colors = self.PROJECT_TREND_COLORS
 
         for idx, (project_name, daily_data) in enumerate(project_daily_stats.items()):
             color = colors[idx % len(colors)]
@@ -990,11 +1019,7 @@ class DashboardService:
         Returns:
             List of top tools with usage stats
         """
-        analyzer = self._features_analyzer
-        if time_filter:
-            analyzer = self._create_time_filtered_service(
-                time_filter
-            )._features_analyzer
+        analyzer = self._get_analyzer('features_analyzer', time_filter)
 
         top_tools = analyzer.get_top_tools(limit=limit)
 
@@ -1067,11 +1092,7 @@ class DashboardService:
         Returns:
             List of top sub-agents with usage stats
         """
-        analyzer = self._features_analyzer
-        if time_filter:
-            analyzer = self._create_time_filtered_service(
-                time_filter
-            )._features_analyzer
+        analyzer = self._get_analyzer('features_analyzer', time_filter)
 
         top_subagents = analyzer.get_top_subagents(limit=limit)
 
@@ -1108,11 +1129,7 @@ class DashboardService:
         Returns:
             Dict with MCP server usage data
         """
-        analyzer = self._features_analyzer
-        if time_filter:
-            analyzer = self._create_time_filtered_service(
-                time_filter
-            )._features_analyzer
+        analyzer = self._get_analyzer('features_analyzer', time_filter)
 
         # Get all tool stats from the tool parser
         all_tools = analyzer.tool_parser.get_tool_stats(time_filter=time_filter)
@@ -1190,8 +1207,11 @@ class DashboardService:
         total_mcp_servers = len(servers)
         total_mcp_tools = len(mcp_tools)
         total_mcp_calls = sum(stats.invocation_count for stats in mcp_tools.values())
-        total_mcp_tokens = sum(s["total_tokens"] for s in servers.values())
-        total_mcp_cost = sum(s["total_cost"] for s in servers.values())
+        total_mcp_tokens = 0
+        total_mcp_cost = 0.0
+        for server in servers.values():
+            total_mcp_tokens += server["total_tokens"]
+            total_mcp_cost += server["total_cost"]
         most_used_server = (
             sorted_servers[0]["server_name"] if sorted_servers else "None"
         )
@@ -1219,11 +1239,7 @@ class DashboardService:
         Returns:
             Dict with file operation statistics
         """
-        analyzer = self._features_analyzer
-        if time_filter:
-            analyzer = self._create_time_filtered_service(
-                time_filter
-            )._features_analyzer
+        analyzer = self._get_analyzer('features_analyzer', time_filter)
 
         # Get all tool invocations
         file_ops = {}
@@ -1256,10 +1272,10 @@ class DashboardService:
             ops.pop("projects")  # Remove set before returning
             files_list.append(ops)
 
-        # Sort by total operations
-        sorted_files = sorted(
-            files_list, key=lambda x: x["total_operations"], reverse=True
-        )[:limit]
+        # Keep only the most-operated-on files
+        sorted_files = heapq.nlargest(
+            limit, files_list, key=lambda x: x["total_operations"]
+        )
 
         # Calculate statistics
         total_files = len(file_ops)
@@ -1605,7 +1621,9 @@ class DashboardService:
                     "agent_id": e.agent_id,
                     "session_id": e.session_id,
                     "project": e.project,
-                    "project_name": Path(e.project).name if e.project else "Unknown",
+                    "project_name": _project_name(e.project)
+                    if e.project
+                    else "Unknown",
                     "timestamp": e.timestamp,
                     "date": e.timestamp[:10] if e.timestamp else "",
                     "time": e.timestamp[11:19] if len(e.timestamp) > 19 else "",
@@ -1721,7 +1739,9 @@ class DashboardService:
                     "agent_id": e.agent_id,
                     "session_id": e.session_id,
                     "project": e.project,
-                    "project_name": Path(e.project).name if e.project else "Unknown",
+                    "project_name": _project_name(e.project)
+                    if e.project
+                    else "Unknown",
                     "timestamp": e.timestamp,
                     "duration_ms": e.duration_ms,
                     "duration_seconds": round(e.duration_seconds, 1),
@@ -1781,15 +1801,7 @@ class DashboardService:
         exchanges = self._subagent_parser.parse_exchanges(time_filter=time_filter)
         exchanges = exchanges[:limit]
 
-        # Color map for different subagent types
-        type_colors = {
-            "explore": "#0770E3",  # Blue
-            "Explore": "#0770E3",
-            "general": "#34D399",  # Green
-            "research": "#F59E0B",  # Amber
-            "code": "#8B5CF6",  # Purple
-            "unknown": "#6B7280",  # Gray
-        }
+        type_colors = self.SUBAGENT_TYPE_COLORS
 
         # Group exchanges by subagent_type for datasets
         type_data: Dict[str, list] = {}
@@ -1872,7 +1884,7 @@ class DashboardService:
                 sessions_map[session_id] = {
                     "session_id": session_id,
                     "project": inv.project,
-                    "project_name": Path(inv.project).name
+                    "project_name": _project_name(inv.project)
                     if inv.project
                     else "Unknown",
                     "invocations": [],
@@ -2022,7 +2034,7 @@ class DashboardService:
                     "r": min(15, max(4, inv.total_tokens / 1000)),  # Scale bubble size
                     "invocation_id": invocation_id,
                     "session_id": inv.session_id,
-                    "project": Path(inv.project).name if inv.project else "Unknown",
+                    "project": _project_name(inv.project) if inv.project else "Unknown",
                     "cost": round(cost, 6),
                     "input_tokens": inv.input_tokens,
                     "output_tokens": inv.output_tokens,
@@ -2152,7 +2164,7 @@ class DashboardService:
                     "time": inv.timestamp[11:19] if len(inv.timestamp) > 19 else "",
                     "session_id": inv.session_id,
                     "project": inv.project,
-                    "project_name": Path(inv.project).name
+                    "project_name": _project_name(inv.project)
                     if inv.project
                     else "Unknown",
                     "input_params": inv.input_params,
@@ -2204,7 +2216,7 @@ class DashboardService:
             sessions_set.add(
                 (
                     inv.session_id,
-                    Path(inv.project).name if inv.project else "Unknown",
+                    _project_name(inv.project) if inv.project else "Unknown",
                 )
             )
 
@@ -2212,20 +2224,8 @@ class DashboardService:
         invocations.sort(key=lambda x: x.timestamp)
         invocations = invocations[-limit:]  # Keep most recent
 
-        # Define colors for different tools
-        tool_colors = {
-            "Read": {"bg": "#3B82F680", "border": "#3B82F6"},  # Blue
-            "Write": {"bg": "#10B98180", "border": "#10B981"},  # Green
-            "Edit": {"bg": "#F59E0B80", "border": "#F59E0B"},  # Amber
-            "Bash": {"bg": "#6366F180", "border": "#6366F1"},  # Indigo
-            "Glob": {"bg": "#8B5CF680", "border": "#8B5CF6"},  # Violet
-            "Grep": {"bg": "#EC489980", "border": "#EC4899"},  # Pink
-            "Task": {"bg": "#EF444480", "border": "#EF4444"},  # Red
-            "WebFetch": {"bg": "#06B6D480", "border": "#06B6D4"},  # Cyan
-            "TodoWrite": {"bg": "#84CC1680", "border": "#84CC16"},  # Lime
-            "TodoRead": {"bg": "#22C55E80", "border": "#22C55E"},  # Green
-        }
-        default_color = {"bg": "#6B728080", "border": "#6B7280"}  # Gray
+        tool_colors = self.TOOL_COLORS
+        default_color = self.DEFAULT_TOOL_COLOR
 
         # Group invocations by tool for datasets
         tools_data: Dict[str, list] = {}
@@ -2263,7 +2263,7 @@ class DashboardService:
                 "invocation_id": invocation_id,
                 "tool_name": tool_name,
                 "session_id": inv.session_id,
-                "project": Path(inv.project).name if inv.project else "Unknown",
+                "project": _project_name(inv.project) if inv.project else "Unknown",
                 "cost": round(cost, 6),
                 "input_tokens": inv.input_tokens,
                 "output_tokens": inv.output_tokens,